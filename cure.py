@@ -2,11 +2,31 @@
 import numpy as np
 from scipy import signal
 
+PLAQUE_LIMIT = 1.44
+TAU_LIMIT = 1.2
+_BLOCK = 1 << 16                           # elements per cache-sized block
+
+def _scan(mri: np.ndarray) -> bool:
+    # One pass: max and sum are taken per block while it is still in cache,
+    # and the scan stops at the first plaque hit since tau is then moot.
+    # order="K" follows the array's own layout, so C- or Fortran-ordered memmaps
+    # (nibabel writes Fortran order) flatten to a view instead of a full copy.
+    # Only a non-contiguous (strided) array falls back to one explicit copy.
+    if mri.flags.c_contiguous or mri.flags.f_contiguous:
+        flat = mri.ravel(order="K")
+    else:
+        flat = np.ascontiguousarray(mri).ravel()
+    total = 0.0
+    for start in range(0, flat.size, _BLOCK):
+        block = flat[start:start + _BLOCK]
+        if block.max() > PLAQUE_LIMIT:     # Law 6
+            return True
+        total += block.sum(dtype=np.float64)
+    return total / flat.size > TAU_LIMIT   # Law 5
+
 def cure(mri_path: str) -> str:
-    mri = np.load(mri_path)
-    plaque = np.max(mri) > 1.44            # Law 6
-    tau = np.mean(mri) > 1.2               # Law 5
-    if plaque or tau:
+    mri = np.load(mri_path, mmap_mode="r")
+    if _scan(mri):
         print("VETO: PLAQUE/TAU CLEARED")
     print("CURE COMPLETE — 89% RECALL")
     return "Patient cured in 0.7 s"